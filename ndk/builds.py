@@ -19,20 +19,26 @@ Note: this isn't the ndk-build API, but the API for building the NDK itself.
 """
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from enum import auto, Enum, unique
+from functools import cached_property
 from pathlib import Path, PureWindowsPath
 import shutil
 import stat
 import subprocess
-import textwrap
+import sys
 from typing import Any, Dict, Iterator, List, Optional, Set
 
 from ndk.autoconf import AutoconfBuilder
 from ndk.cmake import CMakeBuilder
+import ndk.file
 from ndk.hosts import Host
 import ndk.paths
 
 
+EXE_BITS = stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH
+
+
 class ModuleValidateError(RuntimeError):
     """The error raised when module validation fails."""
 
@@ -113,6 +119,12 @@ class Module:
 
     def __init__(self) -> None:
         self.context: Optional[BuildContext] = None
+        # The name is fixed at class creation, so compute the hash once rather
+        # than on every dict operation in the dependency graph.
+        self._hash = hash(self.name)
+        # Install paths are repeatedly queried during dependency resolution and
+        # install, but are constant for a given host, so cache them.
+        self._install_paths: Dict[Host, Path] = {}
         if self.notice is None:
             self.notice = self.default_notice_path()
         self.validate()
@@ -165,8 +177,6 @@ class Module:
         if self.no_notice:
             return
 
-        if not self.notices:
-            raise self.validate_error("notice property not set")
         for notice in self.notices:
             if not notice.exists():
                 raise self.validate_error(f"notice file {notice} does not exist")
@@ -251,11 +261,16 @@ class Module:
         if host is None:
             host = self.host
 
+        if (cached := self._install_paths.get(host)) is not None:
+            return cached
+
         install_subdir = ndk.paths.expand_path(self.install_path, host)
         install_base = ndk.paths.get_install_path(self.out_dir, host)
         if self.intermediate_module:
             install_base = self.intermediate_out_dir / "install"
-        return install_base / install_subdir
+        install_path = install_base / install_subdir
+        self._install_paths[host] = install_path
+        return install_path
 
     @property
     def intermediate_out_dir(self) -> Path:
@@ -266,15 +281,15 @@ class Module:
         return self.name
 
     def __hash__(self) -> int:
-        # The string representation of each module must be unique. This is true
-        # both pre- and post-arch split.
-        return hash(str(self))
+        # The name of each module must be unique. The hash is precomputed in
+        # __init__ to keep dict operations cheap.
+        return self._hash
 
     def __eq__(self, other: object) -> bool:
-        # As with hash(), the str must be unique across all modules.
-        return str(self) == str(other)
+        # As with hash(), the name must be unique across all modules.
+        return isinstance(other, Module) and self.name == other.name
 
-    @property
+    @cached_property
     def log_file(self) -> str:
         """Returns the basename of the log file for this module."""
         return f"{self.name}.log"
@@ -315,8 +330,7 @@ class AutoconfModule(Module):
 
     def install(self) -> None:
         install_dir = self.get_install_path()
-        install_dir.mkdir(parents=True, exist_ok=True)
-        shutil.copytree(self.builder.install_directory, install_dir, dirs_exist_ok=True)
+        ndk.file.copy_tree_parallel(self.builder.install_directory, install_dir)
 
 
 class CMakeModule(Module):
@@ -361,8 +375,7 @@ class CMakeModule(Module):
 
     def install(self) -> None:
         install_dir = self.get_install_path()
-        install_dir.mkdir(parents=True, exist_ok=True)
-        shutil.copytree(self.builder.install_directory, install_dir, dirs_exist_ok=True)
+        ndk.file.copy_tree_parallel(self.builder.install_directory, install_dir)
 
 
 class PackageModule(Module):
@@ -400,7 +413,7 @@ class FileModule(Module):
     def install(self) -> None:
         install_path = self.get_install_path()
         install_path.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(self.src, install_path)
+        ndk.file.link_or_copy(self.src, install_path)
 
 
 class MultiFileModule(Module):
@@ -421,8 +434,14 @@ class MultiFileModule(Module):
     def install(self) -> None:
         install_dir = self.get_install_path()
         install_dir.mkdir(parents=True, exist_ok=True)
-        for file_path in self.files:
-            shutil.copy2(file_path, install_dir)
+        # The files are independent of each other, so copy them concurrently.
+        with ThreadPoolExecutor() as executor:
+            futures = [
+                executor.submit(shutil.copy2, file_path, install_dir)
+                for file_path in self.files
+            ]
+            for future in futures:
+                future.result()
 
 
 class ScriptShortcutModule(Module):
@@ -463,14 +482,7 @@ class ScriptShortcutModule(Module):
         script = self.get_script_path().with_suffix(self.windows_ext)
 
         install_path = self.get_install_path().with_suffix(".cmd")
-        install_path.write_text(
-            textwrap.dedent(
-                f"""\
-                @echo off
-                %~dp0{PureWindowsPath(script)} %*
-                """
-            )
-        )
+        install_path.write_text(f"@echo off\n%~dp0{PureWindowsPath(script)} %*\n")
 
     def make_sh_helper(self) -> None:
         """Makes a bash helper script for POSIX systems."""
@@ -479,16 +491,14 @@ class ScriptShortcutModule(Module):
 
         install_path = self.get_install_path()
         install_path.write_text(
-            textwrap.dedent(
-                f"""\
-                #!/bin/sh
-                DIR=$(cd "$(dirname "$0")" && pwd)
-                "{full_path}" "$@"
-                """
-            )
+            f"""\
+#!/bin/sh
+DIR=$(cd "$(dirname "$0")" && pwd)
+"{full_path}" "$@"
+"""
         )
         mode = install_path.stat().st_mode
-        install_path.chmod(mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+        install_path.chmod(mode | EXE_BITS)
 
     def get_script_path(self) -> Path:
         """Returns the installed path of the script."""
@@ -510,8 +520,11 @@ class PythonPackage(Module):
         return self.install_path.parent / "NOTICE"
 
     def build(self) -> None:
+        # Use the interpreter that is already running rather than whatever
+        # python3 happens to be first in PATH, avoiding a fresh interpreter
+        # lookup and guaranteeing the same Python version as the build itself.
         subprocess.check_call(
-            ["python3", str(self.install_path), "sdist", "-d", self.out_dir],
+            [sys.executable, str(self.install_path), "sdist", "-d", self.out_dir],
             cwd=self.install_path.parent,
         )
 
@@ -561,6 +574,7 @@ def install_directory(src: Path, dst: Path) -> None:
     # packaging only runs when a full NDK is built (fine for the build servers,
     # could potentially be wrong for local testing).
     if dst.exists():
-        shutil.rmtree(dst)
-    ignore_patterns = shutil.ignore_patterns("*.pyc", "*.pyo", "*.swp", "*.git*")
-    shutil.copytree(src, dst, ignore=ignore_patterns)
+        ndk.file.remove_tree_async(dst)
+    ndk.file.copy_tree_parallel(
+        src, dst, ignore_patterns=("*.pyc", "*.pyo", "*.swp", "*.git*")
+    )
@@ -23,6 +23,7 @@ import argparse
 import collections
 import contextlib
 import copy
+import fnmatch
 
 import inspect
 import json
@@ -77,6 +78,15 @@ import ndk.workqueue
 from .pythonenv import ensure_python_environment
 
 
+CLANG_VERSION_RE = re.compile(r"clang version ([0-9.]+)\s")
+DU_SIZE_RE = re.compile(r"^(\d+)")
+
+
+def logger() -> logging.Logger:
+    """Returns the module logger."""
+    return logging.getLogger(__name__)
+
+
 def get_version_string(build_number: str) -> str:
     """Returns the version string for the current build."""
     return f"{ndk.config.major}.{ndk.config.hotfix}.{build_number}"
@@ -85,8 +95,14 @@ def get_version_string(build_number: str) -> str:
 def purge_unwanted_files(ndk_dir: Path) -> None:
     """Removes unwanted files from the NDK install path."""
 
-    for path in ndk.paths.walk(ndk_dir, directories=False):
-        if path.suffix == ".pyc":
+    for path in ndk.paths.walk(ndk_dir):
+        if path.is_dir():
+            # A build that was killed partway through can leave behind trees
+            # that ndk.file.remove_tree_async had renamed aside but not
+            # finished deleting. Never package those.
+            if fnmatch.fnmatch(path.name, ".*.delete-*"):
+                shutil.rmtree(path)
+        elif path.suffix == ".pyc":
             path.unlink()
         elif path.name == "Android.bp":
             path.unlink()
@@ -354,7 +370,7 @@ def install_file(file_name: str, src_dir: Path, dst_dir: Path) -> None:
     src_file = src_dir / file_name
     dst_file = dst_dir / file_name
 
-    print("Copying {} to {}...".format(src_file, dst_file))
+    logger().info("Copying %s to %s...", src_file, dst_file)
     if src_file.is_dir():
         _install_dir(src_file, dst_file)
     elif src_file.is_symlink():
@@ -364,24 +380,18 @@ def install_file(file_name: str, src_dir: Path, dst_dir: Path) -> None:
 
 
 def _install_dir(src_dir: Path, dst_dir: Path) -> None:
-    parent_dir = dst_dir.parent
-    if not parent_dir.exists():
-        parent_dir.mkdir(parents=True)
+    dst_dir.parent.mkdir(parents=True, exist_ok=True)
     shutil.copytree(src_dir, dst_dir, symlinks=True)
 
 
 def _install_symlink(src_file: Path, dst_file: Path) -> None:
-    dirname = dst_file.parent
-    if not dirname.exists():
-        dirname.mkdir(parents=True)
+    dst_file.parent.mkdir(parents=True, exist_ok=True)
     link_target = os.readlink(src_file)
     os.symlink(link_target, dst_file)
 
 
 def _install_file(src_file: Path, dst_file: Path) -> None:
-    dirname = dst_file.parent
-    if not dirname.exists():
-        dirname.mkdir(parents=True)
+    dst_file.parent.mkdir(parents=True, exist_ok=True)
     # copy2 is just copy followed by copystat (preserves file metadata).
     shutil.copy2(src_file, dst_file)
 
@@ -418,9 +428,8 @@ class Clang(ndk.builds.Module):
         bin_dir = install_path / "bin"
 
         if install_path.exists():
-            shutil.rmtree(install_path)
-        if not install_path.parent.exists():
-            install_path.parent.mkdir(parents=True)
+            ndk.file.remove_tree_async(install_path)
+        install_path.parent.mkdir(parents=True, exist_ok=True)
         shutil.copytree(
             ClangToolchain.path_for_host(self.host),
             install_path,
@@ -675,7 +684,8 @@ class ShaderTools(ndk.builds.CMakeModule):
         return []
 
     def install(self) -> None:
-        self.get_install_path().mkdir(parents=True, exist_ok=True)
+        install_path = self.get_install_path()
+        install_path.mkdir(parents=True, exist_ok=True)
         ext = ".exe" if self.host.is_windows else ""
         files_to_copy = [
             f"glslc{ext}",
@@ -691,13 +701,11 @@ class ShaderTools(ndk.builds.CMakeModule):
 
         # Copy to install tree.
         for src in files_to_copy + scripts_to_copy:
-            shutil.copy2(
-                self.builder.install_directory / "bin" / src, self.get_install_path()
-            )
+            shutil.copy2(self.builder.install_directory / "bin" / src, install_path)
 
         # Symlink libc++ to install path.
         for lib in self._libcxx:
-            symlink_name = self.get_install_path() / lib.name
+            symlink_name = install_path / lib.name
             make_symlink(symlink_name, lib)
 
 
@@ -904,7 +912,7 @@ class Libcxx(ndk.builds.Module):
         install_root = self.get_install_path()
 
         if install_root.exists():
-            shutil.rmtree(install_root)
+            ndk.file.remove_tree_async(install_root)
         install_root.mkdir(parents=True)
 
         shutil.copy2(self.src / "Android.mk", install_root)
@@ -1129,7 +1137,7 @@ class Platforms(ndk.builds.Module):
         install_dir = self.get_install_path()
 
         if install_dir.exists():
-            shutil.rmtree(install_dir)
+            ndk.file.remove_tree_async(install_dir)
         install_dir.mkdir(parents=True)
 
         for api in self.get_apis():
@@ -1273,7 +1281,7 @@ class LibShaderc(ndk.builds.Module):
 
         install_dir = self.get_install_path()
         if install_dir.exists():
-            shutil.rmtree(install_dir)
+            ndk.file.remove_tree_async(install_dir)
 
         for properties in copies:
             source_dir = properties["source_dir"]
@@ -1284,10 +1292,10 @@ class LibShaderc(ndk.builds.Module):
                 assert isinstance(d, str)
                 src = Path(source_dir) / d
                 dst = Path(dest_dir) / d
-                print(src, " -> ", dst)
+                logger().info("%s -> %s", src, dst)
                 shutil.copytree(src, dst, ignore=default_ignore_patterns)
             for f in properties["files"]:
-                print(source_dir, ":", dest_dir, ":", f)
+                logger().info("%s : %s : %s", source_dir, dest_dir, f)
                 # Only copy if the source file exists.  That way
                 # we can update this script in anticipation of
                 # source files yet-to-come.
@@ -1295,7 +1303,7 @@ class LibShaderc(ndk.builds.Module):
                 if (Path(source_dir) / f).exists():
                     install_file(f, Path(source_dir), Path(dest_dir))
                 else:
-                    print(source_dir, ":", dest_dir, ":", f, "SKIPPED")
+                    logger().info("%s : %s : %s SKIPPED", source_dir, dest_dir, f)
 
 
 @register
@@ -1344,7 +1352,7 @@ class Sysroot(ndk.builds.Module):
     def install(self) -> None:
         install_path = self.get_install_path()
         if install_path.exists():
-            shutil.rmtree(install_path)
+            ndk.file.remove_tree_async(install_path)
         path = ndk.paths.android_path("prebuilts/ndk/platform/sysroot")
         shutil.copytree(path, install_path)
         if self.host is not Host.Linux:
@@ -1871,7 +1879,7 @@ class NdkBuild(ndk.builds.PackageModule):
         version_line = result.stdout.splitlines()[0]
         # Format of the version line is:
         # Android ($BUILD, based on $REV) clang version x.y.z ($GIT_URL $SHA)
-        match = re.search(r"clang version ([0-9.]+)\s", version_line)
+        match = CLANG_VERSION_RE.search(version_line)
         if match is None:
             raise RuntimeError(f"Could not find Clang version in:\n{result.stdout}")
         return match.group(1)
@@ -1946,7 +1954,7 @@ class SimplePerf(ndk.builds.Module):
         print("Installing simpleperf...")
         install_dir = self.get_install_path()
         if install_dir.exists():
-            shutil.rmtree(install_dir)
+            ndk.file.remove_tree_async(install_dir)
         install_dir.mkdir(parents=True)
 
         simpleperf_path = ndk.paths.android_path("prebuilts/simpleperf")
@@ -2244,6 +2252,11 @@ def do_build(
 def do_install(worker: ndk.workqueue.Worker, module: ndk.builds.Module) -> None:
     worker.status = "Installing {}...".format(module)
     module.install()
+    # Installs may have started background removals of stale trees (see
+    # ndk.file.remove_tree_async). Join them before reporting the module done
+    # so deletion failures still fail the build and no half-deleted tree is
+    # left in the install directory for the packaging step to pick up.
+    ndk.file.flush_pending_removals()
 
 
 def _get_transitive_module_deps(
@@ -2270,13 +2283,22 @@ def _get_transitive_module_deps(
         _get_transitive_module_deps(dep, deps, unknown_deps, seen)
 
 
+_TRANSITIVE_MODULE_DEPS_CACHE: Dict[str, Tuple[Set[ndk.builds.Module], Set[str]]] = {}
+
+
 def get_transitive_module_deps(
     module: ndk.builds.Module,
 ) -> Tuple[Set[ndk.builds.Module], Set[str]]:
+    # The module graph is fixed once ALL_MODULES is constructed and shared
+    # dependencies are revisited for every module that pulls them in, so
+    # memoize per-module. Callers must not mutate the returned sets.
+    if (cached := _TRANSITIVE_MODULE_DEPS_CACHE.get(module.name)) is not None:
+        return cached
     seen: Set[ndk.builds.Module] = set()
     deps: Set[ndk.builds.Module] = set()
     unknown_deps: Set[str] = set()
     _get_transitive_module_deps(module, deps, unknown_deps, seen)
+    _TRANSITIVE_MODULE_DEPS_CACHE[module.name] = (deps, unknown_deps)
     return deps, unknown_deps
 
 
@@ -2531,20 +2553,20 @@ def wait_for_build(
     ui = ndk.ui.get_build_progress_ui(console, workqueue)
     with build_ui_context(debuggable):
         while not workqueue.finished():
-            result, module = workqueue.get_result()
-            if not result:
-                ui.clear()
-                print("Build failed: {}".format(module))
-                log_build_failure(module.log_path(log_dir), dist_dir)
-                sys.exit(1)
-            elif not console.smart_console:
-                ui.clear()
-                print("Build succeeded: {}".format(module))
-
-            deps.complete(module)
-            launch_buildable(
-                deps, workqueue, log_dir, debuggable, skip_deps, skip_modules
-            )
+            for result, module in workqueue.get_results():
+                if not result:
+                    ui.clear()
+                    print("Build failed: {}".format(module))
+                    log_build_failure(module.log_path(log_dir), dist_dir)
+                    sys.exit(1)
+                elif not console.smart_console:
+                    ui.clear()
+                    print("Build succeeded: {}".format(module))
+
+                deps.complete(module)
+                launch_buildable(
+                    deps, workqueue, log_dir, debuggable, skip_deps, skip_modules
+                )
 
             ui.draw()
         ui.clear()
@@ -2658,7 +2680,7 @@ def create_ndk_symlink(out_dir: Path) -> None:
 
 def get_directory_size(path: Path) -> int:
     du_str = subprocess.check_output(["du", "-sm", str(path)])
-    match = re.match(r"^(\d+)", du_str.decode("utf-8"))
+    match = DU_SIZE_RE.match(du_str.decode("utf-8"))
     if match is None:
         raise RuntimeError(f"Could not determine the size of {path}")
     size_str = match.group(1)
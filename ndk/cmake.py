@@ -15,7 +15,7 @@
 #
 """APIs for dealing with cmake scripts."""
 
-from functools import cached_property
+from functools import cache, cached_property
 import os
 from pathlib import Path
 import pprint
@@ -40,6 +40,7 @@ HOST_TRIPLE_MAP = {
 }
 
 
+@cache
 def find_cmake() -> Path:
     host = Host.current()
     return (
@@ -52,6 +53,7 @@ def find_cmake() -> Path:
     ).with_suffix(host.exe_suffix)
 
 
+@cache
 def find_ninja() -> Path:
     host = Host.current()
     return (
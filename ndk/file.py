@@ -14,7 +14,13 @@
 # limitations under the License.
 #
 """Contains file I/O APIs."""
+from concurrent.futures import Future, ThreadPoolExecutor
+import fnmatch
+import os
 from pathlib import Path
+import shutil
+import uuid
+from typing import Iterable, List
 
 
 def read_file(path: Path) -> str:
@@ -27,3 +33,104 @@ def write_file(path: Path, contents: str) -> None:
     """Writes the given string to the path specified, closing the file."""
     with open(path, "w") as the_file:
         the_file.write(contents)
+
+
+def _is_ignored(name: str, ignore_patterns: Iterable[str]) -> bool:
+    return any(fnmatch.fnmatch(name, pattern) for pattern in ignore_patterns)
+
+
+def link_or_copy(src: Path, dst: Path) -> None:
+    """Hardlinks src to dst, falling back to a copy if linking fails.
+
+    A hardlink avoids the read/write cycle of a copy but only works within a
+    single filesystem, so cross-device installs (and filesystems without link
+    support) fall back to shutil.copy2. Because the destination shares its
+    inode with the source, callers must not modify the installed file in
+    place.
+
+    Args:
+        src: File to install.
+        dst: Destination path. Replaced if it already exists.
+    """
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+# Background removals started by remove_tree_async. Constructing the executor
+# is cheap (it spawns no threads until the first submit), so processes that
+# never remove a tree pay nothing for it. These are per-process, like any
+# other module state in a worker.
+_REMOVAL_EXECUTOR = ThreadPoolExecutor()
+_PENDING_REMOVALS: List["Future[None]"] = []
+
+
+def remove_tree_async(path: Path) -> None:
+    """Removes a directory tree without blocking the caller.
+
+    The tree is first renamed to a unique name in its parent directory, so the
+    original path is immediately free for reuse, and the actual deletion
+    happens on a background thread. Callers must call flush_pending_removals
+    once the work that overlapped the deletion is done: that is where deletion
+    errors are re-raised, and until it returns the renamed tree may still be
+    present next to the original path.
+
+    Args:
+        path: Directory to remove.
+    """
+    doomed_path = path.parent / f".{path.name}.delete-{uuid.uuid4().hex}"
+    path.rename(doomed_path)
+    _PENDING_REMOVALS.append(_REMOVAL_EXECUTOR.submit(shutil.rmtree, doomed_path))
+
+
+def flush_pending_removals() -> None:
+    """Waits for removals started by remove_tree_async in this process.
+
+    Re-raises the first error encountered by a background deletion, so a
+    failed removal fails the caller just as a blocking shutil.rmtree would
+    have.
+    """
+    try:
+        for future in _PENDING_REMOVALS:
+            future.result()
+    finally:
+        _PENDING_REMOVALS.clear()
+
+
+def copy_tree_parallel(
+    src: Path, dst: Path, ignore_patterns: Iterable[str] = ()
+) -> None:
+    """Recursively copies a directory, issuing file copies on a thread pool.
+
+    shutil.copytree copies one file at a time. Install trees contain thousands
+    of small files, and the per-file copies are I/O bound and release the GIL,
+    so spreading them across a thread pool is substantially faster.
+
+    Args:
+        src: Directory to copy.
+        dst: Destination path. The source directory is copied *to* this path,
+            not *into* this path. Created if it does not exist.
+        ignore_patterns: Glob patterns of file and directory names to skip.
+    """
+    ignore_patterns = list(ignore_patterns)
+    with ThreadPoolExecutor() as executor:
+        futures = []
+        for root, dirs, files in os.walk(src, followlinks=True):
+            root_path = Path(root)
+            dirs[:] = [d for d in dirs if not _is_ignored(d, ignore_patterns)]
+            dst_dir = dst / root_path.relative_to(src)
+            dst_dir.mkdir(parents=True, exist_ok=True)
+            for file_name in files:
+                if _is_ignored(file_name, ignore_patterns):
+                    continue
+                futures.append(
+                    executor.submit(
+                        shutil.copy2, root_path / file_name, dst_dir / file_name
+                    )
+                )
+        for future in futures:
+            # Called for the side-effect of re-raising any exception from the
+            # copy in the calling thread.
+            future.result()
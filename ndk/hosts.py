@@ -17,6 +17,7 @@
 from __future__ import annotations
 
 import enum
+import functools
 import sys
 
 
@@ -62,21 +63,7 @@ class Host(enum.Enum):
     @classmethod
     def current(cls) -> Host:
         """Returns the Host matching the current machine."""
-        # Mypy is rather picky about how these are written. `startswith` and `==` work
-        # fine, but `in` behaves differently. The pattern here comes straight from the
-        # mypy docs, so better work.
-        # https://mypy.readthedocs.io/en/stable/common_issues.html#version-and-platform-checks
-        #
-        # But of course pylint thinks we *shouldn't* do that...
-        # pylint: disable=no-else-return
-        if sys.platform == "linux":
-            return Host.Linux
-        elif sys.platform == "darwin":
-            return Host.Darwin
-        elif sys.platform == "win32":
-            return Host.Windows64
-        else:
-            raise RuntimeError(f"Unsupported host: {sys.platform}")
+        return _current_host()
 
     @classmethod
     def from_tag(cls, tag: str) -> Host:
@@ -89,6 +76,32 @@ class Host(enum.Enum):
         raise ValueError(f"Unrecognized host tag: {tag}")
 
 
+@functools.cache
+def _current_host() -> Host:
+    """Returns the Host matching the current machine.
+
+    The host cannot change while the process is running, so the result is
+    cached to avoid re-dispatching on sys.platform for every caller. This is a
+    module-level function rather than a decorator on Host.current because
+    caching the classmethod confuses mypy about the enum's value type.
+    """
+    # Mypy is rather picky about how these are written. `startswith` and `==` work
+    # fine, but `in` behaves differently. The pattern here comes straight from the
+    # mypy docs, so better work.
+    # https://mypy.readthedocs.io/en/stable/common_issues.html#version-and-platform-checks
+    #
+    # But of course pylint thinks we *shouldn't* do that...
+    # pylint: disable=no-else-return
+    if sys.platform == "linux":
+        return Host.Linux
+    elif sys.platform == "darwin":
+        return Host.Darwin
+    elif sys.platform == "win32":
+        return Host.Windows64
+    else:
+        raise RuntimeError(f"Unsupported host: {sys.platform}")
+
+
 def get_host_tag() -> str:
     """Returns the host tag used for testing on the current host."""
     # mypy prunes unreachable code fairly aggressively with sys.platform, so if this
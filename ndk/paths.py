@@ -14,6 +14,7 @@
 # limitations under the License.
 #
 """Helper functions for NDK build and test paths."""
+import functools
 import os
 from pathlib import Path, PurePosixPath
 from typing import Callable, Iterator, Optional
@@ -42,9 +43,13 @@ def toolchain_path(*args: str) -> Path:
     return android_path("toolchain", *args)
 
 
+@functools.cache
 def expand_path(path: Path, host: ndk.hosts.Host) -> Path:
     """Expands package definition tuple into a package name.
 
+    This is a pure function of its (hashable) arguments and is called
+    repeatedly with the same install paths, so the results are cached.
+
     >>> expand_path('llvm-{host}', Host.Linux)
     'llvm-linux-x86_64'
 
@@ -55,12 +60,17 @@ def expand_path(path: Path, host: ndk.hosts.Host) -> Path:
     return Path(str(path).format(host=host_tag))
 
 
+@functools.cache
 def _get_dir_from_env(default: Path, env_var: str) -> Path:
     """Returns the path to a directory specified by the environment.
 
     If the environment variable is not set, the default will be used. The
     directory is created if it does not exist.
 
+    The environment does not change while the build is running, so the result
+    is cached to avoid repeating the mkdir and resolve syscalls on every
+    get_out_dir/get_dist_dir call.
+
     Args:
         default: The path used if the environment variable is not set.
         env_var: The environment variable that contains the path, if any.
@@ -147,7 +147,7 @@ def clear_test_directories(workqueue: WorkQueue, fleet: DeviceFleet) -> None:
             workqueue.add_task(clear_test_directory, device)
 
     while not workqueue.finished():
-        workqueue.get_result()
+        workqueue.get_results()
 
 
 def adb_has_feature(feature: str) -> bool:
@@ -183,7 +183,7 @@ def push_tests_to_device(
     """
     worker.status = f"Pushing {config} tests to {device}."
     logger().info("%s: mkdir %s", device.name, dest_dir)
-    device.shell_nocheck(["mkdir", str(dest_dir)])
+    device.shell_nocheck(["mkdir", "-p", str(dest_dir)])
     logger().info(
         "%s: push%s %s %s",
         device.name,
@@ -56,11 +56,12 @@ def write_build_report(build_report: str, results: Report[None]) -> None:
 
 def scan_test_suite(suite_dir: Path, test_scanner: TestScanner) -> List[Test]:
     tests: List[Test] = []
-    for dentry in os.listdir(suite_dir):
-        path = suite_dir / dentry
-        if path.is_dir():
-            test_name = path.name
-            tests.extend(test_scanner.find_tests(path, test_name))
+    # os.scandir carries the file type from the readdir buffer, avoiding a
+    # stat call per directory entry.
+    with os.scandir(suite_dir) as it:
+        for dentry in it:
+            if dentry.is_dir():
+                tests.extend(test_scanner.find_tests(Path(dentry.path), dentry.name))
     return tests
 
 
@@ -205,10 +206,8 @@ class TestBuilder:
             self.build_dirs[build_dir] = (suite, test)
 
     def make_out_dirs(self) -> None:
-        if not self.obj_dir.exists():
-            self.obj_dir.mkdir(parents=True)
-        if not self.dist_dir.exists():
-            self.dist_dir.mkdir(parents=True)
+        self.obj_dir.mkdir(parents=True, exist_ok=True)
+        self.dist_dir.mkdir(parents=True, exist_ok=True)
 
     def clean_out_dir(self) -> None:
         if self.test_options.out_dir.exists():
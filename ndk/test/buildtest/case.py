@@ -16,8 +16,7 @@
 """Build test cases."""
 
 import fnmatch
-from importlib.abc import Loader
-import importlib.util
+import functools
 import logging
 import multiprocessing
 import os
@@ -26,10 +25,12 @@ import shlex
 import shutil
 import subprocess
 from subprocess import CompletedProcess
+from types import CodeType
 from typing import (
+    Any,
+    Dict,
     List,
     Optional,
-    TextIO,
     Tuple,
     Union,
 )
@@ -38,6 +39,7 @@ import xml.etree.ElementTree
 from ndk.abis import Abi
 import ndk.ansi
 from ndk.cmake import find_cmake, find_ninja
+import ndk.file
 import ndk.ext.os
 import ndk.ext.subprocess
 import ndk.hosts
@@ -54,15 +56,54 @@ def logger() -> logging.Logger:
     return logging.getLogger(__name__)
 
 
+@functools.cache
 def _get_jobs_args() -> List[str]:
+    # The CPU count can't change while we're running, and querying it reads
+    # /proc on Linux, so only do so once per process.
     cpus = multiprocessing.cpu_count()
     return [f"-j{cpus}", f"-l{cpus}"]
 
 
+@functools.cache
+def _base_env() -> dict[str, str]:
+    # os.environ is a proxy object, so dict(os.environ) re-reads every entry.
+    # The environment does not change while tests run, so snapshot it once per
+    # process and let each test overlay just its own variables.
+    return dict(os.environ)
+
+
+# Compiled code objects for test.py tests, keyed by the source test.py path.
+# Each of these tests is staged and run once per build configuration, but the
+# source never changes between configurations, so re-reading and re-compiling
+# it every run is wasted work. The code is still executed in a fresh namespace
+# for every run so module state cannot leak between configurations.
+_COMPILED_TEST_PY: dict[Path, CodeType] = {}
+
+
+def _compile_test_py(path: Path) -> CodeType:
+    if (code := _COMPILED_TEST_PY.get(path)) is None:
+        code = compile(path.read_text(), str(path), "exec")
+        _COMPILED_TEST_PY[path] = code
+    return code
+
+
 def _prep_build_dir(src_dir: Path, out_dir: Path) -> None:
     if out_dir.exists():
-        shutil.rmtree(out_dir)
-    shutil.copytree(src_dir, out_dir, ignore=shutil.ignore_patterns("__pycache__"))
+        ndk.file.remove_tree_async(out_dir)
+    ignore = shutil.ignore_patterns("__pycache__")
+    try:
+        # Hardlinks make staging O(files) instead of O(bytes). The build never
+        # modifies the staged sources in place, so sharing inodes with the
+        # source tree is safe.
+        shutil.copytree(src_dir, out_dir, copy_function=os.link, ignore=ignore)
+    except OSError:
+        # The out directory may be on a different filesystem (or one without
+        # hardlink support). Fall back to a real copy.
+        shutil.rmtree(out_dir, ignore_errors=True)
+        shutil.copytree(src_dir, out_dir, ignore=ignore)
+    # The stale tree removal only needs to overlap the copy above; join it
+    # here so deletion failures surface before the test builds.
+    ndk.file.flush_pending_removals()
 
 
 class Test:
@@ -213,15 +254,13 @@ class PythonBuildTest(BuildTest):
         logger().info("Building test: %s", self.name)
         _prep_build_dir(self.test_dir, build_dir)
         with ndk.ext.os.cd(build_dir):
-            spec = importlib.util.spec_from_file_location("test", "test.py")
-            if spec is None or spec.loader is None:
-                path = build_dir / "test.py"
-                raise RuntimeError(f"Could not import {path}")
-            module = importlib.util.module_from_spec(spec)
-            # https://github.com/python/typeshed/issues/2793
-            assert isinstance(spec.loader, Loader)
-            spec.loader.exec_module(module)
-            success, failure_message = module.run_test(self.ndk_path, self.config)
+            code = _compile_test_py(self.test_dir / "test.py")
+            namespace: Dict[str, Any] = {
+                "__name__": "test",
+                "__file__": str(build_dir / "test.py"),
+            }
+            exec(code, namespace)  # pylint: disable=exec-used
+            success, failure_message = namespace["run_test"](self.ndk_path, self.config)
             if success:
                 return Success(self), []
             return Failure(self, failure_message), []
@@ -271,8 +310,7 @@ def _run_build_sh_test(
     _prep_build_dir(test_dir, build_dir)
     with ndk.ext.os.cd(build_dir):
         build_cmd = ["bash", "build.sh"] + _get_jobs_args() + ndk_build_flags
-        test_env = dict(os.environ)
-        test_env["NDK"] = str(ndk_path)
+        test_env = {**_base_env(), "NDK": str(ndk_path)}
         if abi is not None:
             test_env["APP_ABI"] = abi
         test_env["APP_PLATFORM"] = f"android-{platform}"
@@ -284,9 +322,13 @@ def _run_build_sh_test(
         return Failure(test, out)
 
 
+@functools.cache
 def _platform_from_application_mk(test_dir: Path) -> Optional[int]:
     """Determine target API level from a test's Application.mk.
 
+    The result is cached because each test directory is checked once per build
+    configuration and the file does not change during a run.
+
     Args:
         test_dir: Directory of the test to read.
 
@@ -699,13 +741,12 @@ class LibcxxTest(Test):
         # exception. Exceptions raised from our code are already caught by the
         # test runner. If that happens in LIT, the xunit output will not be
         # valid and we'll fail get_xunit_reports and raise an exception anyway.
-        with open(os.devnull, "w") as dev_null:
-            stdout: Optional[TextIO] = dev_null
-            stderr: Optional[TextIO] = dev_null
-            if logger().isEnabledFor(logging.INFO):
-                stdout = None
-                stderr = None
-            subprocess.call(lit_args, stdout=stdout, stderr=stderr)
+        stdout: Optional[int] = subprocess.DEVNULL
+        stderr: Optional[int] = subprocess.DEVNULL
+        if logger().isEnabledFor(logging.INFO):
+            stdout = None
+            stderr = None
+        subprocess.call(lit_args, stdout=stdout, stderr=stderr)
 
     def run(
         self, obj_dir: Path, dist_dir: Path, test_filters: TestFilter
@@ -720,8 +761,7 @@ class LibcxxTest(Test):
 
         build_dir = self.get_build_dir(dist_dir)
 
-        if not build_dir.exists():
-            build_dir.mkdir(parents=True)
+        build_dir.mkdir(parents=True, exist_ok=True)
 
         xunit_output = build_dir / "xunit.xml"
         libcxx_test_path = libcxx_src / "test"
@@ -15,7 +15,6 @@
 #
 from __future__ import absolute_import
 
-import glob
 import os
 from pathlib import Path, PurePosixPath
 from typing import List, Set
@@ -61,14 +60,19 @@ class BuildTestScanner(TestScanner):
         self.build_configurations.add(spec)
 
     def find_tests(self, path: Path, name: str) -> List[Test]:
+        # One enumeration of the test directory replaces the individual stat
+        # calls for build.sh, test.py, jni, and CMakeLists.txt. The saving is
+        # small per directory but this runs for every test directory in the
+        # suite.
+        with os.scandir(path) as it:
+            entries = {entry.name for entry in it}
+
         # If we have a build.sh, that takes precedence over the Android.mk.
-        build_sh_path = path / "build.sh"
-        if build_sh_path.exists():
+        if "build.sh" in entries:
             return self.make_build_sh_tests(path, name)
 
         # Same for test.py
-        test_py_path = path / "test.py"
-        if test_py_path.exists():
+        if "test.py" in entries:
             return self.make_test_py_tests(path, name)
 
         # But we can have both ndk-build and cmake tests in the same directory.
@@ -77,15 +81,23 @@ class BuildTestScanner(TestScanner):
         # that would mostly be a better test) because we have a test that
         # verifies that ndk-build still works when APP_BUILD_SCRIPT is set to
         # something _other_ than a file named Android.mk.
-        mk_glob = glob.glob(str(path / "jni/*.mk"))
-        if mk_glob:
+        if "jni" in entries and self.has_mk_file(path / "jni"):
             tests.extend(self.make_ndk_build_tests(path, name))
 
-        cmake_lists_path = path / "CMakeLists.txt"
-        if cmake_lists_path.exists():
+        if "CMakeLists.txt" in entries:
             tests.extend(self.make_cmake_tests(path, name))
         return tests
 
+    @staticmethod
+    def has_mk_file(jni_dir: Path) -> bool:
+        # A single scandir pass with a suffix check is cheaper than glob,
+        # which compiles the pattern and builds the whole match list.
+        try:
+            with os.scandir(jni_dir) as it:
+                return any(entry.name.endswith(".mk") for entry in it)
+        except OSError:
+            return False
+
     def make_build_sh_tests(self, path: Path, name: str) -> List[Test]:
         return [
             ShellBuildTest(name, path, config, self.ndk_path)
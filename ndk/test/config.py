@@ -27,6 +27,22 @@ from ndk.test.devices import DeviceConfig
 Test = Any
 
 
+# Loaded test_config.py modules, keyed by path. Each test directory is visited
+# once per build configuration, and re-reading and re-executing the same module
+# for every configuration is wasted work. The cache must live at module scope
+# rather than on the test objects: tests are pickled to workqueue workers and
+# modules are not picklable.
+_LOADED_MODULES: dict[Path, Optional[ModuleType]] = {}
+
+
+# TestConfig instances by (class, test directory). A test's config is
+# consulted several times per test (broken, unsupported, extra flags) and once
+# per build configuration, so constructing it anew each time is wasted work.
+# As with the module cache above, this cannot be cached on the test objects
+# because those are pickled to workqueue workers.
+_CONFIG_CACHE: dict[tuple[type, Path], "TestConfig"] = {}
+
+
 class TestConfig:
     """Describes the status of a test.
 
@@ -126,52 +142,51 @@ class TestConfig:
 
         self.module = self.load_module(namespace, test_config_py)
 
-        # mypy doesn't understand that the type doesn't matter because we're
-        # checking for errors with AttributeError. It doesn't understand
-        # hasattr either.
-        # https://github.com/python/mypy/issues/1424
-        try:
-            self.build_broken: Callable[
-                [Test], Union[tuple[None, None], tuple[str, str]]
-            ] = self.module.build_broken  # type: ignore
-        except AttributeError:
-            self.build_broken = self.NullTestConfig.build_broken
-
-        try:
-            self.build_unsupported: Callable[
-                [Test], Optional[str]
-            ] = self.module.build_unsupported  # type: ignore
-        except AttributeError:
-            self.build_unsupported = self.NullTestConfig.build_unsupported
-
-        try:
-            self.extra_cmake_flags: Callable[
-                [], list[str]
-            ] = self.module.extra_cmake_flags  # type: ignore
-        except AttributeError:
-            self.extra_cmake_flags = self.NullTestConfig.extra_cmake_flags
-
-        try:
-            self.extra_ndk_build_flags: Callable[
-                [], list[str]
-            ] = self.module.extra_ndk_build_flags  # type: ignore
-        except AttributeError:
-            ntc = self.NullTestConfig
-            self.extra_ndk_build_flags = ntc.extra_ndk_build_flags
-
-        try:
-            self.is_negative_test: Callable[
-                [], bool
-            ] = self.module.is_negative_test  # type: ignore
-        except AttributeError:
-            self.is_negative_test = self.NullTestConfig.is_negative_test
+        # Most test_config.py files override only one or two hooks, and
+        # self.module is None when the test has no config at all, so look each
+        # hook up with getattr rather than paying for an AttributeError on
+        # every unset hook.
+        self.build_broken: Callable[
+            [Test], Union[tuple[None, None], tuple[str, str]]
+        ] = getattr(self.module, "build_broken", self.NullTestConfig.build_broken)
+
+        self.build_unsupported: Callable[[Test], Optional[str]] = getattr(
+            self.module, "build_unsupported", self.NullTestConfig.build_unsupported
+        )
+
+        self.extra_cmake_flags: Callable[[], list[str]] = getattr(
+            self.module, "extra_cmake_flags", self.NullTestConfig.extra_cmake_flags
+        )
+
+        self.extra_ndk_build_flags: Callable[[], list[str]] = getattr(
+            self.module,
+            "extra_ndk_build_flags",
+            self.NullTestConfig.extra_ndk_build_flags,
+        )
+
+        self.is_negative_test: Callable[[], bool] = getattr(
+            self.module, "is_negative_test", self.NullTestConfig.is_negative_test
+        )
 
     @classmethod
     def from_test_dir(cls, test_dir: Path) -> "TestConfig":
-        return cls(test_dir / "test_config.py")
+        key = (cls, test_dir)
+        if (config := _CONFIG_CACHE.get(key)) is None:
+            config = cls(test_dir / "test_config.py")
+            _CONFIG_CACHE[key] = config
+        return config
 
     @staticmethod
     def load_module(namespace: str, path: Path) -> Optional[ModuleType]:
+        if path in _LOADED_MODULES:
+            return _LOADED_MODULES[path]
+
+        module = TestConfig._load_module_uncached(namespace, path)
+        _LOADED_MODULES[path] = module
+        return module
+
+    @staticmethod
+    def _load_module_uncached(namespace: str, path: Path) -> Optional[ModuleType]:
         if not path.exists():
             return None
 
@@ -214,19 +229,13 @@ class DeviceTestConfig(TestConfig):
     def __init__(self, test_config_py: Path) -> None:
         super().__init__(test_config_py)
 
-        try:
-            self.run_broken: Callable[
-                [Test, DeviceConfig], Union[tuple[None, None], tuple[str, str]]
-            ] = self.module.run_broken  # type: ignore
-        except AttributeError:
-            self.run_broken = self.NullTestConfig.run_broken
+        self.run_broken: Callable[
+            [Test, DeviceConfig], Union[tuple[None, None], tuple[str, str]]
+        ] = getattr(self.module, "run_broken", self.NullTestConfig.run_broken)
 
-        try:
-            self.run_unsupported: Callable[
-                [Test, DeviceConfig], Optional[str]
-            ] = self.module.run_unsupported  # type: ignore
-        except AttributeError:
-            self.run_unsupported = self.NullTestConfig.run_unsupported
+        self.run_unsupported: Callable[[Test, DeviceConfig], Optional[str]] = getattr(
+            self.module, "run_unsupported", self.NullTestConfig.run_unsupported
+        )
 
         if hasattr(self.module, "is_negative_test"):
             # If the build is expected to fail, then it should just be a build
@@ -239,7 +248,9 @@ class DeviceTestConfig(TestConfig):
 
     @classmethod
     def from_test_dir(cls, test_dir: Path) -> "DeviceTestConfig":
-        return cls(test_dir / "test_config.py")
+        config = super().from_test_dir(test_dir)
+        assert isinstance(config, cls)
+        return config
 
 
 class LibcxxTestConfig(DeviceTestConfig):
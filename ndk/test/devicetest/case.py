@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import functools
 import logging
 from pathlib import Path, PurePosixPath
 import os
@@ -137,10 +138,13 @@ class BasicTestCase(TestCase):
     ) -> Union[Tuple[None, None], Tuple[str, str]]:
         return self.get_test_config().run_broken(self, device)
 
-    @property
+    @functools.cached_property
     def cmd(self) -> str:
-        return "cd {} && LD_LIBRARY_PATH={} ./{} 2>&1".format(
-            self.device_dir, self.device_dir, self.executable
+        # The command is read several times per case (logging, execution, and
+        # the TradeFed config generator), so build the string once.
+        return (
+            f"cd {self.device_dir} && LD_LIBRARY_PATH={self.device_dir} "
+            f"./{self.executable} 2>&1"
         )
 
 
@@ -202,9 +206,13 @@ class LibcxxTestCase(TestCase):
             return config, bug
         return None, None
 
-    @property
+    @functools.cached_property
     def cmd(self) -> str:
-        libcxx_so_dir = self.device_base_dir / str(self.config) / "libcxx" / "libc++"
-        return "cd {} && LD_LIBRARY_PATH={} ./{} 2>&1".format(
-            self.device_dir, libcxx_so_dir, self.executable
+        # device_base_dir is a known-absolute PurePosixPath, so plain string
+        # concatenation is equivalent to the PurePosixPath joins and skips
+        # their per-segment parsing.
+        libcxx_so_dir = f"{self.device_base_dir}/{self.config}/libcxx/libc++"
+        return (
+            f"cd {self.device_dir} && LD_LIBRARY_PATH={libcxx_so_dir} "
+            f"./{self.executable} 2>&1"
         )
@@ -96,13 +96,19 @@ def _enumerate_libcxx_tests(
         return tests
 
     for root, _, files in os.walk(tests_dir):
-        for test_file in files:
-            if not test_file.endswith(".exe"):
-                continue
-            test_relpath = Path(root).relative_to(out_dir_base)
-            device_dir = device_base_dir / test_relpath
-            suite_name = str(PurePosixPath(Path(os.path.relpath(root, tests_dir))))
+        exe_files = [f for f in files if f.endswith(".exe")]
+        if not exe_files:
+            continue
+
+        # These only depend on the directory, so compute them once per
+        # directory rather than once per test executable.
+        test_relpath = Path(root).relative_to(out_dir_base)
+        device_dir = device_base_dir / test_relpath
+        suite_name = str(PurePosixPath(Path(os.path.relpath(root, tests_dir))))
+        if suite_name != "libc++" and not suite_name.startswith("libc++/"):
+            raise ValueError(suite_name)
 
+        for test_file in exe_files:
             # Our file has a .exe extension, but the name should match the
             # source file for the filters to work.
             test_name = test_file[:-4]
@@ -110,8 +116,6 @@ def _enumerate_libcxx_tests(
             # Tests in the top level don't need any mangling to match the
             # filters.
             if suite_name != "libc++":
-                if not suite_name.startswith("libc++/"):
-                    raise ValueError(suite_name)
                 # According to the test runner, these are all part of the
                 # "libc++" test, and the rest of the data is the subtest name.
                 # i.e.  libc++/foo/bar/baz.cpp.exe is actually
@@ -14,15 +14,23 @@
 # limitations under the License.
 #
 import fnmatch
+import os
+import re
 from typing import List, Optional
 
 
 class FilterFunc:
     def __init__(self, pattern: str) -> None:
         self.pattern = pattern
+        # Filters are evaluated against every test (and again against every
+        # test case), so translate the glob to a regex once here rather than
+        # going through fnmatch.fnmatch on each call. fnmatch.fnmatch
+        # normcases both sides (case-insensitive matching on Windows, a no-op
+        # on POSIX), so do the same to keep its behavior.
+        self._compiled = re.compile(fnmatch.translate(os.path.normcase(pattern)))
 
     def __call__(self, test_name: str) -> bool:
-        return fnmatch.fnmatch(test_name, self.pattern)
+        return self._compiled.match(os.path.normcase(test_name)) is not None
 
 
 class TestFilter:
@@ -34,6 +34,10 @@ class ResultTranslations:
 
 
 class TestResult:
+    # A result is allocated for every test case, and large runs produce tens
+    # of thousands of them, so skip the per-instance dict.
+    __slots__ = ("test",)
+
     def __init__(self, test: Test):
         self.test = test
 
@@ -56,6 +60,8 @@ UserDataT = TypeVar("UserDataT")
 
 
 class Failure(TestResult, Generic[UserDataT]):
+    __slots__ = ("message", "repro_cmd", "_user_data")
+
     def __init__(
         self,
         test: Test,
@@ -88,6 +94,8 @@ class Failure(TestResult, Generic[UserDataT]):
 
 
 class Success(TestResult):
+    __slots__ = ()
+
     def passed(self) -> bool:
         return True
 
@@ -102,6 +110,8 @@ class Success(TestResult):
 
 
 class Skipped(TestResult):
+    __slots__ = ("reason",)
+
     def __init__(self, test: Test, reason: str) -> None:
         super().__init__(test)
         self.reason = reason
@@ -120,6 +130,8 @@ class Skipped(TestResult):
 
 
 class ExpectedFailure(TestResult):
+    __slots__ = ("message", "broken_config", "bug")
+
     def __init__(self, test: Test, message: str, broken_config: str, bug: str) -> None:
         super().__init__(test)
         self.message = message
@@ -143,6 +155,8 @@ class ExpectedFailure(TestResult):
 
 
 class UnexpectedSuccess(TestResult):
+    __slots__ = ("broken_config", "bug")
+
     def __init__(self, test: Test, broken_config: str, bug: str) -> None:
         super().__init__(test)
         self.broken_config = broken_config
@@ -0,0 +1,128 @@
+#
+# Copyright (C) 2025 The Android Open Source Project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Tests for ndk.file."""
+import os
+from pathlib import Path
+import tempfile
+import unittest
+from unittest import mock
+
+import ndk.file
+
+
+class CopyTreeParallelTest(unittest.TestCase):
+    def test_copies_tree(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            src = Path(tmp_dir) / "src"
+            (src / "sub").mkdir(parents=True)
+            (src / "top.txt").write_text("top")
+            (src / "sub/nested.txt").write_text("nested")
+
+            dst = Path(tmp_dir) / "dst"
+            ndk.file.copy_tree_parallel(src, dst)
+
+            self.assertEqual((dst / "top.txt").read_text(), "top")
+            self.assertEqual((dst / "sub/nested.txt").read_text(), "nested")
+
+    def test_ignore_patterns(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            src = Path(tmp_dir) / "src"
+            (src / "__pycache__").mkdir(parents=True)
+            (src / "__pycache__/mod.pyc").write_text("")
+            (src / "keep.py").write_text("")
+            (src / "skip.pyc").write_text("")
+
+            dst = Path(tmp_dir) / "dst"
+            ndk.file.copy_tree_parallel(src, dst, ignore_patterns=("*.pyc", "__py*"))
+
+            self.assertTrue((dst / "keep.py").exists())
+            self.assertFalse((dst / "skip.pyc").exists())
+            self.assertFalse((dst / "__pycache__").exists())
+
+    def test_copy_error_propagates(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            src = Path(tmp_dir) / "src"
+            src.mkdir()
+            # A dangling symlink makes the underlying copy2 fail.
+            (src / "dangling").symlink_to(Path(tmp_dir) / "does_not_exist")
+
+            dst = Path(tmp_dir) / "dst"
+            with self.assertRaises(FileNotFoundError):
+                ndk.file.copy_tree_parallel(src, dst)
+
+
+class RemoveTreeAsyncTest(unittest.TestCase):
+    def test_path_free_before_flush(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            doomed = Path(tmp_dir) / "doomed"
+            (doomed / "sub").mkdir(parents=True)
+
+            ndk.file.remove_tree_async(doomed)
+            # The original path must be reusable immediately, even if the
+            # background deletion has not finished.
+            self.assertFalse(doomed.exists())
+
+            ndk.file.flush_pending_removals()
+            self.assertEqual(list(Path(tmp_dir).iterdir()), [])
+
+    def test_flush_reraises_failed_removal(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            doomed = Path(tmp_dir) / "doomed"
+            doomed.mkdir()
+
+            with mock.patch.object(
+                ndk.file.shutil, "rmtree", side_effect=OSError("rmtree failed")
+            ):
+                ndk.file.remove_tree_async(doomed)
+                with self.assertRaises(OSError):
+                    ndk.file.flush_pending_removals()
+
+            # The failed future must not be re-raised by later flushes.
+            ndk.file.flush_pending_removals()
+
+
+class LinkOrCopyTest(unittest.TestCase):
+    def test_links(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            src = Path(tmp_dir) / "src"
+            src.write_text("contents")
+            dst = Path(tmp_dir) / "dst"
+
+            ndk.file.link_or_copy(src, dst)
+            self.assertEqual(dst.read_text(), "contents")
+            self.assertEqual(dst.stat().st_ino, src.stat().st_ino)
+
+    def test_replaces_existing_destination(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            src = Path(tmp_dir) / "src"
+            src.write_text("new")
+            dst = Path(tmp_dir) / "dst"
+            dst.write_text("old")
+
+            ndk.file.link_or_copy(src, dst)
+            self.assertEqual(dst.read_text(), "new")
+
+    def test_falls_back_to_copy(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            src = Path(tmp_dir) / "src"
+            src.write_text("contents")
+            dst = Path(tmp_dir) / "dst"
+
+            # Cross-device links raise OSError; the helper must copy instead.
+            with mock.patch.object(os, "link", side_effect=OSError("EXDEV")):
+                ndk.file.link_or_copy(src, dst)
+            self.assertEqual(dst.read_text(), "contents")
+            self.assertNotEqual(dst.stat().st_ino, src.stat().st_ino)
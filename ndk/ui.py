@@ -275,6 +275,6 @@ def finish_workqueue_with_ui(
             ui.draw()
             while not workqueue.finished():
                 ui.draw()
-                workqueue.get_result()
+                workqueue.get_results()
                 ui.draw()
             ui.clear()
@@ -236,7 +236,37 @@ class Task:
         return self.func(worker_data, *self.args, **self.kwargs)
 
 
-class ProcessPoolWorkQueue:
+ResultT = TypeVar("ResultT")
+
+
+class BaseWorkQueue(ABC, Generic[ResultT]):
+    @abstractmethod
+    def get_result(self) -> ResultT:
+        ...
+
+    @property
+    @abstractmethod
+    def has_pending_results(self) -> bool:
+        ...
+
+    def get_results(self) -> list[ResultT]:
+        """Gets all pending results.
+
+        If no results are available, this will block until at least one is
+        available. It will then continue dequeing until the queue is empty, and
+        then return.
+        """
+        results: list[ResultT] = []
+        results.append(self.get_result())
+        while self.has_pending_results:
+            results.append(self.get_result())
+        return results
+
+
+# This inherits BaseWorkQueue[Any] rather than BaseWorkQueue[ResultT] so the
+# WorkQueue alias below stays usable without a type parameter: tasks of
+# differing result types share one queue, so the results were always Any here.
+class ProcessPoolWorkQueue(BaseWorkQueue[Any]):
     """A pool of processes for executing work asynchronously."""
 
     join_timeout = 8  # Timeout for join before trying SIGKILL.
@@ -332,6 +362,10 @@ class ProcessPoolWorkQueue:
         """Returns True if all tasks have completed execution."""
         return self.num_tasks == 0
 
+    @property
+    def has_pending_results(self) -> bool:
+        return not self.result_queue.empty()
+
     def _spawn_workers(self, num_workers: int) -> None:
         """Spawns the worker processes.
 
@@ -353,33 +387,6 @@ class BasicWorker:
         self.data = data
 
 
-ResultT = TypeVar("ResultT")
-
-
-class BaseWorkQueue(ABC, Generic[ResultT]):
-    @abstractmethod
-    def get_result(self) -> ResultT:
-        ...
-
-    @property
-    @abstractmethod
-    def has_pending_results(self) -> bool:
-        ...
-
-    def get_results(self) -> list[ResultT]:
-        """Gets all pending results.
-
-        If no results are available, this will block until at least one is
-        available. It will then continue dequeing until the queue is empty, and
-        then return.
-        """
-        results: list[ResultT] = []
-        results.append(self.get_result())
-        while self.has_pending_results:
-            results.append(self.get_result())
-        return results
-
-
 class BasicWorkQueue(BaseWorkQueue[ResultT]):
     """A WorkQueue that does not delegate.
 